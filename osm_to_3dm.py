@@ -18,13 +18,20 @@ The script requires the :mod:`rhino3dm` package which can be installed with
 from __future__ import annotations
 
 import argparse
+import bisect
+import collections.abc
+import functools
+import io
+import itertools
 import math
+import os
 import sys
 import tempfile
-import xml.etree.ElementTree as ET
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, IO, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from typing import Any, Dict, FrozenSet, IO, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 try:
     import rhino3dm
@@ -33,22 +40,63 @@ except ImportError as exc:  # pragma: no cover - dependency guidance
         "The 'rhino3dm' package is required. Install it with 'pip install rhino3dm'."
     ) from exc
 
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - optional faster parser
+    import xml.etree.ElementTree as ET
+
+    _HAVE_LXML = False
+else:
+    _HAVE_LXML = True
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional vectorised projection
+    np = None
+
 # Average storey height used when only ``building:levels`` is available.
 DEFAULT_LEVEL_HEIGHT = 3.0
 # Height used whenever a geometry is missing explicit height information.
 DEFAULT_BUILDING_HEIGHT = 10.0
+# WGS84 semi-major axis in metres, used for the local tangent plane.
+_EARTH_RADIUS = 6378137.0
 
 
 OSMSource = Union[Path, str, bytes, IO[bytes]]
 
+# Top-level OSM elements that ``parse_osm`` cares about.
+_OSM_ELEMENT_TAGS = ("node", "way", "relation")
+# Relation types whose members may describe a building footprint.
+_AREA_RELATION_TYPES = frozenset(("multipolygon", "building"))
+# Non-standard member roles that are still understood as outer/inner rings.
+_OUTER_ROLE_ALIASES = frozenset(("outline", "exterior", "shell"))
+_INNER_ROLE_ALIASES = frozenset(("interior", "hole"))
+# Height tags copied from a building member way onto its relation.
+_HEIGHT_TAGS = frozenset(("height", "min_height"))
+# Tags stored as user strings besides every ``building*`` tag.
+_USER_STRING_TAGS = frozenset(("height", "min_height", "name"))
+# Tag values shorter than this are deduplicated while parsing.
+_SHARED_VALUE_MAX_LENGTH = 32
+# Below this many vertices NumPy call overhead outweighs vectorising a ring.
+_ARRAY_RING_MIN_POINTS = 64
+# Edge/point tests below which ray casting in Python beats broadcasting.
+_ARRAY_RAY_CAST_MIN_TESTS = 512
+# Upper bound on the edge/point matrix evaluated by one broadcast ray cast.
+_ARRAY_RAY_CAST_BATCH = 1 << 20
+
 
 @dataclass
 class Feature:
-    """A single extrudable OSM footprint."""
+    """A single extrudable OSM footprint.
+
+    Rings are sequences of coordinate pairs.  Features built from a
+    :class:`NodeCoordinates` table hold :class:`NodeRing` views into it rather
+    than lists.
+    """
 
     osm_id: str
-    outer: List[Tuple[float, float]]
-    holes: List[List[Tuple[float, float]]]
+    outer: Sequence[Tuple[float, float]]
+    holes: List[Sequence[Tuple[float, float]]]
     tags: Dict[str, str]
 
     @property
@@ -56,6 +104,116 @@ class Feature:
         return self.tags.get("name")
 
 
+class NodeCoordinates:
+    """Compact mapping of OSM node ids to ``(lat, lon)`` pairs.
+
+    Coordinates live in two flat float arrays instead of one tuple per node,
+    which matters for city-scale exports with millions of nodes.
+    """
+
+    __slots__ = ("_index", "_lat", "_lon")
+
+    def __init__(self) -> None:
+        self._index: Dict[int, int] = {}
+        self._lat = array("d")
+        self._lon = array("d")
+
+    def add(self, node_id: int, lat: float, lon: float) -> None:
+        index = self._index.get(node_id)
+        if index is None:
+            self._index[node_id] = len(self._lat)
+            self._lat.append(lat)
+            self._lon.append(lon)
+        else:
+            self._lat[index] = lat
+            self._lon[index] = lon
+
+    def __getitem__(self, node_id: int) -> Tuple[float, float]:
+        index = self._index[node_id]
+        return self._lat[index], self._lon[index]
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def ring(self, node_ids: Iterable[int]) -> NodeRing:
+        """Return the ring through ``node_ids``, raising KeyError for unknown ids."""
+
+        return NodeRing(self, array("q", map(self._index.__getitem__, node_ids)))
+
+
+class NodeRing(collections.abc.Sequence):
+    """Ring of ``(lat, lon)`` pairs stored as row indices into a node table.
+
+    A vertex costs one 8 byte index instead of a tuple and two floats; the
+    pairs are only built on access, and the projection gathers whole rings
+    straight from the table's arrays.  Slices and pickles are plain lists.
+    """
+
+    __slots__ = ("_nodes", "_rows")
+
+    def __init__(self, nodes: NodeCoordinates, rows: array) -> None:
+        self._nodes = nodes
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return list(NodeRing(self._nodes, self._rows[index]))
+        row = self._rows[index]
+        return self._nodes._lat[row], self._nodes._lon[row]
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        rows = self._rows
+        return zip(map(self._nodes._lat.__getitem__, rows), map(self._nodes._lon.__getitem__, rows))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, collections.abc.Sequence) and not isinstance(other, (str, bytes)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"NodeRing({list(self)!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Worker processes get the coordinates, not the whole node table.
+        return list, (list(self),)
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+        coords = np.empty((len(self._rows), 2))
+        if len(self._rows):
+            rows = np.frombuffer(self._rows, dtype=np.int64)
+            np.take(np.frombuffer(self._nodes._lat, dtype=np.float64), rows, out=coords[:, 0])
+            np.take(np.frombuffer(self._nodes._lon, dtype=np.float64), rows, out=coords[:, 1])
+        return coords if dtype is None else coords.astype(dtype, copy=False)
+
+
+# Node coordinates as returned by parse_osm, or a plain ``{id: (lat, lon)}``.
+NodeLookup = Union[NodeCoordinates, Mapping[int, Tuple[float, float]]]
+
+
+def _lookup_ring(nodes: NodeLookup, node_ids: Sequence[int]) -> Sequence[Tuple[float, float]]:
+    if isinstance(nodes, NodeCoordinates):
+        return nodes.ring(node_ids)
+    return [nodes[node_id] for node_id in node_ids]
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("input", type=Path, help="Path to an OSM XML file")
@@ -72,46 +230,118 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=DEFAULT_LEVEL_HEIGHT,
         help="Storey height to use when only building:levels is provided",
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Number of worker processes used to build the geometry",
+    )
     return parser.parse_args(argv)
 
 
+def _iter_osm_elements(source: OSMSource) -> Iterator[Any]:
+    """Stream top-level OSM elements, discarding each one once it was handled.
+
+    lxml is used when it is installed because its iterparse can filter by tag
+    in C; otherwise the standard library parser is used.  Either way only the
+    element currently being processed is kept in memory.
+    """
+
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    elif isinstance(source, Path):
+        source = str(source)
+
+    if _HAVE_LXML:
+        context = ET.iterparse(
+            source,
+            events=("end",),
+            tag=_OSM_ELEMENT_TAGS,
+            huge_tree=True,
+            resolve_entities=False,
+        )
+        for _, element in context:
+            yield element
+            element.clear()
+            # Drop the already processed siblings still referenced by the root.
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+    else:
+        context = ET.iterparse(source, events=("start", "end"))
+        _, root = next(context)
+        for event, element in context:
+            if event != "end" or element.tag not in _OSM_ELEMENT_TAGS:
+                continue
+            yield element
+            element.clear()
+            # The root still lists every cleared element; drop them as well.
+            del root[:]
+
+
 def parse_osm(source: OSMSource) -> Tuple[
-    Dict[int, Tuple[float, float]],
+    NodeCoordinates,
     Dict[int, Tuple[List[int], Dict[str, str]]],
     Dict[int, Tuple[List[Tuple[str, int, str]], Dict[str, str]]],
 ]:
     """Parse the OSM XML document and return nodes, ways and relations."""
 
-    if isinstance(source, bytes):
-        tree = ET.ElementTree(ET.fromstring(source))
-    elif hasattr(source, "read"):
-        tree = ET.parse(source)  # type: ignore[arg-type]
-    else:
-        tree = ET.parse(source)  # type: ignore[arg-type]
-    root = tree.getroot()
-    nodes: Dict[int, Tuple[float, float]] = {}
+    nodes = NodeCoordinates()
     ways: Dict[int, Tuple[List[int], Dict[str, str]]] = {}
     relations: Dict[int, Tuple[List[Tuple[str, int, str]], Dict[str, str]]] = {}
-
-    for element in root:
-        if element.tag == "node":
-            node_id = int(element.attrib["id"])
-            lat = float(element.attrib["lat"])
-            lon = float(element.attrib["lon"])
-            nodes[node_id] = (lat, lon)
-        elif element.tag == "way":
-            way_id = int(element.attrib["id"])
-            node_refs = [int(nd.attrib["ref"]) for nd in element.findall("nd")]
-            tags = {tag.attrib["k"]: tag.attrib["v"] for tag in element.findall("tag")}
-            ways[way_id] = (node_refs, tags)
-        elif element.tag == "relation":
-            relation_id = int(element.attrib["id"])
-            members = [
-                (member.attrib["type"], int(member.attrib["ref"]), member.attrib.get("role", ""))
-                for member in element.findall("member")
-            ]
-            tags = {tag.attrib["k"]: tag.attrib["v"] for tag in element.findall("tag")}
-            relations[relation_id] = (members, tags)
+    # Identically tagged objects (e.g. only ``building=yes``) share one dict.
+    # The shared dicts must therefore never be mutated downstream.
+    shared_tags: Dict[FrozenSet[Tuple[str, str]], Dict[str, str]] = {}
+
+    def share_tags(tags: Dict[str, str]) -> Dict[str, str]:
+        return shared_tags.setdefault(frozenset(tags.items()), tags)
+
+    # Children are visited once, dispatching on their tag, instead of running
+    # a separate findall() per child type.  ``get()`` reads attributes without
+    # materialising an attrib mapping, and hot callables are bound to locals.
+    intern = sys.intern
+    add_node = nodes.add
+    # Short tag values ("yes", "house", "3") and member roles repeat across the
+    # whole export, so every distinct one is stored once for this parse.
+    # Unlike the keys they are not interned process-wide, as values are free
+    # text and the web converter is a long-running process.
+    short_values: Dict[str, str] = {}
+    share_value = short_values.setdefault
+    for element in _iter_osm_elements(source):
+        kind = element.tag
+        get = element.get
+        if kind == "node":
+            add_node(int(get("id")), float(get("lat")), float(get("lon")))
+        elif kind == "way":
+            node_refs: List[int] = []
+            add_ref = node_refs.append
+            tags: Dict[str, str] = {}
+            for child in element:
+                child_kind = child.tag
+                if child_kind == "nd":
+                    add_ref(int(child.get("ref")))
+                elif child_kind == "tag":
+                    value = child.get("v")
+                    if len(value) < _SHARED_VALUE_MAX_LENGTH:
+                        value = share_value(value, value)
+                    tags[intern(child.get("k"))] = value
+            ways[int(get("id"))] = (node_refs, share_tags(tags))
+        elif kind == "relation":
+            members: List[Tuple[str, int, str]] = []
+            add_member = members.append
+            tags = {}
+            for child in element:
+                child_kind = child.tag
+                if child_kind == "member":
+                    role = child.get("role", "")
+                    add_member(
+                        (intern(child.get("type")), int(child.get("ref")), share_value(role, role))
+                    )
+                elif child_kind == "tag":
+                    value = child.get("v")
+                    if len(value) < _SHARED_VALUE_MAX_LENGTH:
+                        value = share_value(value, value)
+                    tags[intern(child.get("k"))] = value
+            relations[int(get("id"))] = (members, share_tags(tags))
 
     return nodes, ways, relations
 
@@ -120,6 +350,7 @@ def is_building(tags: Dict[str, str]) -> bool:
     return "building" in tags or "building:part" in tags
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_float(value: str) -> Optional[float]:
     """Parse a height or level value from OSM."""
 
@@ -143,25 +374,48 @@ def parse_float(value: str) -> Optional[float]:
 def building_height(tags: Dict[str, str], *, default_height: float, level_height: float) -> Tuple[float, float]:
     """Return total height and minimum height in metres."""
 
+    # Many buildings share the same height tagging, so the result is cached on
+    # the relevant tag values rather than recomputed for every feature.
+    return _building_height_from_values(
+        tags.get("min_height"),
+        tags.get("building:min_height"),
+        tags.get("height"),
+        tags.get("building:height"),
+        tags.get("building:levels"),
+        default_height,
+        level_height,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _building_height_from_values(
+    min_height_tag: Optional[str],
+    building_min_height_tag: Optional[str],
+    height_tag: Optional[str],
+    building_height_tag: Optional[str],
+    levels_tag: Optional[str],
+    default_height: float,
+    level_height: float,
+) -> Tuple[float, float]:
     height: Optional[float] = None
     min_height: Optional[float] = None
 
-    for key in ("min_height", "building:min_height"):
-        if key in tags:
-            value = parse_float(tags[key])
+    for value_tag in (min_height_tag, building_min_height_tag):
+        if value_tag is not None:
+            value = parse_float(value_tag)
             if value is not None:
                 min_height = value
                 break
 
-    for key in ("height", "building:height"):
-        if key in tags:
-            value = parse_float(tags[key])
+    for value_tag in (height_tag, building_height_tag):
+        if value_tag is not None:
+            value = parse_float(value_tag)
             if value is not None:
                 height = value
                 break
 
-    if height is None and "building:levels" in tags:
-        levels = parse_float(tags["building:levels"])
+    if height is None and levels_tag is not None:
+        levels = parse_float(levels_tag)
         if levels is not None:
             height = levels * level_height
 
@@ -179,7 +433,7 @@ def building_height(tags: Dict[str, str], *, default_height: float, level_height
 
 def extract_way_feature(
     way_id: int,
-    nodes: Dict[int, Tuple[float, float]],
+    nodes: NodeLookup,
     node_refs: Sequence[int],
     tags: Dict[str, str],
 ) -> Optional[Feature]:
@@ -188,7 +442,7 @@ def extract_way_feature(
     if node_refs[0] != node_refs[-1]:
         return None
     try:
-        ring = [nodes[nid] for nid in node_refs]
+        ring = _lookup_ring(nodes, node_refs)
     except KeyError:
         return None
     return Feature(osm_id=f"way/{way_id}", outer=ring, holes=[], tags=tags)
@@ -197,53 +451,138 @@ def extract_way_feature(
 def assemble_rings(node_sequences: Iterable[Sequence[int]]) -> List[List[int]]:
     """Combine way fragments into closed rings."""
 
-    unused = [list(seq) for seq in node_sequences if len(seq) >= 2]
-    rings: List[List[int]] = []
+    fragments: List[Optional[List[int]]] = [
+        list(seq) for seq in node_sequences if len(seq) >= 2
+    ]
+    # Endpoint node id -> indices of the fragments starting/ending there.
+    by_head: Dict[int, List[int]] = {}
+    by_tail: Dict[int, List[int]] = {}
+    for index, fragment in enumerate(fragments):
+        by_head.setdefault(fragment[0], []).append(index)
+        by_tail.setdefault(fragment[-1], []).append(index)
+
+    def take(endpoints: Dict[int, List[int]], node_id: int) -> Optional[List[int]]:
+        # Consumed fragments are set to None and skipped lazily here.
+        candidates = endpoints.get(node_id)
+        while candidates:
+            index = candidates.pop()
+            fragment = fragments[index]
+            if fragment is not None:
+                fragments[index] = None
+                return fragment
+        return None
 
-    while unused:
-        current = unused.pop()
-        if not current:
+    rings: List[List[int]] = []
+    for start in range(len(fragments) - 1, -1, -1):
+        ring = fragments[start]
+        if ring is None:
             continue
-        ring = list(current)
-        while ring[0] != ring[-1] and unused:
+        fragments[start] = None
+        reversed_once = False
+        while ring[0] != ring[-1]:
             tail = ring[-1]
-            joined = False
-            for index, candidate in enumerate(unused):
-                if not candidate:
-                    continue
-                head = candidate[0]
-                cand_tail = candidate[-1]
-                if head == tail:
-                    ring.extend(candidate[1:])
-                    unused.pop(index)
-                    joined = True
-                    break
-                if cand_tail == tail:
-                    ring.extend(reversed(candidate[:-1]))
-                    unused.pop(index)
-                    joined = True
-                    break
-                if cand_tail == ring[0]:
-                    ring = candidate[:-1] + ring
-                    unused.pop(index)
-                    joined = True
-                    break
-                if head == ring[0]:
-                    ring = list(reversed(candidate[1:])) + ring
-                    unused.pop(index)
-                    joined = True
-                    break
-            if not joined:
+            candidate = take(by_head, tail)
+            if candidate is not None:
+                ring.extend(candidate[1:])
+                continue
+            candidate = take(by_tail, tail)
+            if candidate is not None:
+                ring.extend(reversed(candidate[:-1]))
+                continue
+            if reversed_once:
                 break
+            # Nothing continues the tail, so keep growing from the head.
+            ring.reverse()
+            reversed_once = True
         if ring[0] != ring[-1]:
             ring.append(ring[0])
         rings.append(ring)
     return rings
 
 
+def _ring_centroid(ring: Sequence[Tuple[float, float]]) -> Tuple[float, float]:
+    count = len(ring)
+    if not count:
+        return 0.0, 0.0
+    lat_sum = 0.0
+    lon_sum = 0.0
+    for lat, lon in ring:
+        lat_sum += lat
+        lon_sum += lon
+    return lat_sum / count, lon_sum / count
+
+
+def _ring_bounds(ring: Sequence[Tuple[float, float]]) -> Tuple[float, float, float, float]:
+    """Return ``(min_lat, min_lon, max_lat, max_lon)`` of a ring."""
+
+    lats = [lat for lat, _ in ring]
+    lons = [lon for _, lon in ring]
+    return min(lats), min(lons), max(lats), max(lons)
+
+
+def _ring_contains_point(ring: Sequence[Tuple[float, float]], point: Tuple[float, float]) -> bool:
+    """Ray-cast ``point`` against ``ring``; both are (lat, lon) pairs."""
+
+    if not ring:
+        return False
+    py, px = point
+    inside = False
+    y1, x1 = ring[0]
+    for y2, x2 in ring[1:]:
+        # "px lies left of the edge" compared by cross-multiplication: the
+        # sign of dy orients the cross product, so no division is needed.
+        if ((y1 > py) != (y2 > py)) and (
+            ((x2 - x1) * (py - y1) - (px - x1) * (y2 - y1)) * (y2 - y1) > 0
+        ):
+            inside = not inside
+        y1, x1 = y2, x2
+    return inside
+
+
+def _ring_contains_points(
+    ring: Sequence[Tuple[float, float]],
+    points: Sequence[Tuple[float, float]],
+) -> List[bool]:
+    """Ray-cast several ``points`` against ``ring`` at once.
+
+    With NumPy every edge is tested against a batch of points in a single
+    broadcast expression; small inputs use :func:`_ring_contains_point`.
+    """
+
+    if np is None or len(ring) * len(points) < _ARRAY_RAY_CAST_MIN_TESTS:
+        return [_ring_contains_point(ring, point) for point in points]
+    if len(ring) < 2:
+        return [False] * len(points)
+
+    vertices = np.asarray(ring, dtype=np.float64)
+    y1 = vertices[:-1, 0]
+    x1 = vertices[:-1, 1]
+    y2 = vertices[1:, 0]
+    dy = y2 - y1
+    dx = vertices[1:, 1] - x1
+    coords = np.asarray(points, dtype=np.float64)
+    step = max(1, _ARRAY_RAY_CAST_BATCH // len(dy))
+    inside: List[bool] = []
+    for start in range(0, len(coords), step):
+        batch = coords[start:start + step]
+        py = batch[:, 0:1]
+        # Only a few edges straddle each point's ray; the crossing test is
+        # evaluated for those (point, edge) pairs alone, in the same
+        # division-free form as _ring_contains_point.
+        rows, edges = np.nonzero((y1 > py) != (y2 > py))
+        edge_dy = dy[edges]
+        cross = (
+            dx[edges] * (batch[rows, 0] - y1[edges])
+            - (batch[rows, 1] - x1[edges]) * edge_dy
+        ) * edge_dy
+        crossings = np.bincount(rows[cross > 0], minlength=len(batch))
+        inside.extend((crossings & 1).astype(bool).tolist())
+    return inside
+
+
 def extract_relation_features(
     relation_id: int,
-    nodes: Dict[int, Tuple[float, float]],
+    nodes: NodeLookup,
     ways: Dict[int, Tuple[List[int], Dict[str, str]]],
     members: Sequence[Tuple[str, int, str]],
     tags: Dict[str, str],
@@ -251,7 +590,8 @@ def extract_relation_features(
     """Extract outer rings from a multipolygon relation."""
 
     way_roles: Dict[str, List[List[int]]] = {"outer": [], "inner": []}
-    outer_tags = tags.copy()
+    # Copied on first write only: ``tags`` may be shared with other objects.
+    outer_tags = tags
 
     for member_type, ref, role in members:
         if member_type != "way":
@@ -260,29 +600,31 @@ def extract_relation_features(
             continue
         node_refs, way_tags = ways[ref]
         normalized_role = (role or "outer").lower()
-        if normalized_role in {"outline", "exterior", "shell"}:
+        if normalized_role in _OUTER_ROLE_ALIASES:
             normalized_role = "outer"
-        elif normalized_role in {"interior", "hole"}:
+        elif normalized_role in _INNER_ROLE_ALIASES:
             normalized_role = "inner"
         if normalized_role not in way_roles:
             continue
         way_roles[normalized_role].append(node_refs)
         if not is_building(outer_tags) and is_building(way_tags):
+            if outer_tags is tags:
+                outer_tags = dict(tags)
             outer_tags.update(
                 {
                     k: v
                     for k, v in way_tags.items()
-                    if k.startswith("building") or k in {"height", "min_height"}
+                    if k.startswith("building") or k in _HEIGHT_TAGS
                 }
             )
 
     if not way_roles["outer"]:
         return []
 
-    outer_rings: List[List[Tuple[float, float]]] = []
+    outer_rings: List[Sequence[Tuple[float, float]]] = []
     for ring_node_ids in assemble_rings(way_roles["outer"]):
         try:
-            ring = [nodes[nid] for nid in ring_node_ids]
+            ring = _lookup_ring(nodes, ring_node_ids)
         except KeyError:
             continue
         outer_rings.append(ring)
@@ -290,58 +632,59 @@ def extract_relation_features(
     if not outer_rings:
         return []
 
-    inner_rings: List[List[Tuple[float, float]]] = []
+    inner_rings: List[Sequence[Tuple[float, float]]] = []
     for ring_node_ids in assemble_rings(way_roles["inner"]):
         try:
-            ring = [nodes[nid] for nid in ring_node_ids]
+            ring = _lookup_ring(nodes, ring_node_ids)
         except KeyError:
             continue
         inner_rings.append(ring)
 
-    def ring_centroid(ring: Sequence[Tuple[float, float]]) -> Tuple[float, float]:
-        if not ring:
-            return 0.0, 0.0
-        lat_sum = 0.0
-        lon_sum = 0.0
-        count = 0
-        for lat, lon in ring:
-            lat_sum += lat
-            lon_sum += lon
-            count += 1
-        return lat_sum / count, lon_sum / count
-
-    def ring_contains_point(ring: Sequence[Tuple[float, float]], point: Tuple[float, float]) -> bool:
-        # Use the ray casting algorithm on longitude/latitude pairs.
-        px, py = point[1], point[0]
-        inside = False
-        for (lat1, lon1), (lat2, lon2) in zip(ring, ring[1:]):
-            x1, y1 = lon1, lat1
-            x2, y2 = lon2, lat2
-            intersects = ((y1 > py) != (y2 > py)) and (
-                px < (x2 - x1) * (py - y1) / ((y2 - y1) or 1e-12) + x1
-            )
-            if intersects:
-                inside = not inside
-        return inside
+    # Each hole belongs to the first outer ring containing its centroid.  Hole
+    # centroids are indexed by latitude, so every outer ring only looks at
+    # the band between its bounds, and tests the remaining candidates of that
+    # band against its longitude bounds and then in one batched ray cast.
+    # Outer rings are read several times below, so node views are expanded
+    # into a temporary list once; the features keep the views.
+    centroids = [_ring_centroid(ring) for ring in inner_rings]
+    by_lat = sorted(range(len(centroids)), key=lambda hole_index: centroids[hole_index][0])
+    sorted_lats = [centroids[hole_index][0] for hole_index in by_lat]
+    owners: List[Optional[int]] = [None] * len(inner_rings)
+    remaining = len(inner_rings)
+    for index, outer_ring in enumerate(outer_rings):
+        if not remaining:
+            break
+        outer_coords = list(outer_ring)
+        min_lat, min_lon, max_lat, max_lon = _ring_bounds(outer_coords)
+        start = bisect.bisect_left(sorted_lats, min_lat)
+        end = bisect.bisect_right(sorted_lats, max_lat)
+        candidates = [
+            hole_index
+            for hole_index in by_lat[start:end]
+            if owners[hole_index] is None and min_lon <= centroids[hole_index][1] <= max_lon
+        ]
+        if not candidates:
+            continue
+        contained = _ring_contains_points(
+            outer_coords, [centroids[hole_index] for hole_index in candidates]
+        )
+        for hole_index, inside in zip(candidates, contained):
+            if inside:
+                owners[hole_index] = index
+                remaining -= 1
 
-    unassigned_inners = list(inner_rings)
-    features: List[Feature] = []
+    holes_by_outer: List[List[Sequence[Tuple[float, float]]]] = [[] for _ in outer_rings]
+    for inner_ring, owner in zip(inner_rings, owners):
+        if owner is not None:
+            holes_by_outer[owner].append(inner_ring)
 
-    for outer_ring in outer_rings:
-        assigned: List[List[Tuple[float, float]]] = []
-        remaining_inners: List[List[Tuple[float, float]]] = []
-        for inner_ring in unassigned_inners:
-            centroid = ring_centroid(inner_ring)
-            if ring_contains_point(outer_ring, centroid):
-                assigned.append(inner_ring)
-            else:
-                remaining_inners.append(inner_ring)
-        unassigned_inners = remaining_inners
+    features: List[Feature] = []
+    for outer_ring, holes in zip(outer_rings, holes_by_outer):
         features.append(
             Feature(
                 osm_id=f"relation/{relation_id}",
                 outer=outer_ring,
-                holes=assigned,
+                holes=holes,
                 tags=outer_tags,
             )
         )
@@ -350,30 +693,33 @@ def extract_relation_features(
 
 
 def collect_features(
-    nodes: Dict[int, Tuple[float, float]],
+    nodes: NodeLookup,
     ways: Dict[int, Tuple[List[int], Dict[str, str]]],
     relations: Dict[int, Tuple[List[Tuple[str, int, str]], Dict[str, str]]],
 ) -> List[Feature]:
     features: List[Feature] = []
     relation_way_ids: Set[int] = set()
     relation_candidates: List[Tuple[int, List[Tuple[str, int, str]], Dict[str, str]]] = []
+    # Keeps the original order so features come out in document order.
+    building_ways = {
+        way_id: way for way_id, way in ways.items() if is_building(way[1])
+    }
 
     for relation_id, (members, tags) in relations.items():
-        if tags.get("type") not in {"multipolygon", "building"}:
+        if tags.get("type") not in _AREA_RELATION_TYPES:
             continue
-        relation_candidates.append((relation_id, list(members), tags))
         member_has_building = any(
-            member_type == "way" and is_building(ways.get(ref, ([], {}))[1])
+            member_type == "way" and ref in building_ways
             for member_type, ref, _ in members
         )
         if is_building(tags) or member_has_building:
-            for member_type, ref, _ in members:
-                if member_type == "way":
-                    relation_way_ids.add(ref)
+            # The parsed member list is only read from here on, so no copy.
+            relation_candidates.append((relation_id, members, tags))
+            relation_way_ids.update(
+                ref for member_type, ref, _ in members if member_type == "way"
+            )
 
-    for way_id, (node_refs, tags) in ways.items():
-        if not is_building(tags):
-            continue
+    for way_id, (node_refs, tags) in building_ways.items():
         if way_id in relation_way_ids and "building:part" not in tags:
             # The relation will take care of the main building outline.
             continue
@@ -382,50 +728,78 @@ def collect_features(
             features.append(feature)
 
     for relation_id, members, tags in relation_candidates:
-        if not is_building(tags) and not any(
-            member_type == "way" and is_building(ways.get(ref, ([], {}))[1])
-            for member_type, ref, _ in members
-        ):
-            continue
         features.extend(extract_relation_features(relation_id, nodes, ways, members, tags))
 
     return features
 
 
 def determine_origin(features: Sequence[Feature]) -> Tuple[float, float]:
-    latitudes: List[float] = []
-    longitudes: List[float] = []
+    rings: List[Sequence[Tuple[float, float]]] = []
+    for feature in features:
+        rings.append(feature.outer)
+        rings.extend(feature.holes)
+    table_rows = _node_table_rows(rings)
+    del rings
+    if table_rows is not None:
+        table, positions = table_rows
+        count = len(positions)
+        if count:
+            # cumsum adds strictly left to right, like the running sums below,
+            # so both paths give the same origin.
+            lat_sum = np.cumsum(np.take(np.frombuffer(table._lat, dtype=np.float64), positions))[-1]
+            lon_sum = np.cumsum(np.take(np.frombuffer(table._lon, dtype=np.float64), positions))[-1]
+            return float(lat_sum) / count, float(lon_sum) / count
+
+    # Running sums instead of collecting every coordinate into lists first.
+    lat_sum = 0.0
+    lon_sum = 0.0
+    count = 0
     for feature in features:
         for lat, lon in feature.outer:
-            latitudes.append(lat)
-            longitudes.append(lon)
+            lat_sum += lat
+            lon_sum += lon
+            count += 1
         for hole in feature.holes:
             for lat, lon in hole:
-                latitudes.append(lat)
-                longitudes.append(lon)
-    if not latitudes:
+                lat_sum += lat
+                lon_sum += lon
+                count += 1
+    if not count:
         raise ValueError("No geographic coordinates found in OSM input")
-    return sum(latitudes) / len(latitudes), sum(longitudes) / len(longitudes)
+    return lat_sum / count, lon_sum / count
+
+
+def _projection_scales(origin_lat: float) -> Tuple[float, float]:
+    """Return the metres-per-degree factors for longitude and latitude.
+
+    They only depend on the origin, so the per-point projection is reduced to
+    one subtraction and one multiplication per axis.
+    """
+
+    metres_per_degree = _EARTH_RADIUS * math.pi / 180.0
+    return metres_per_degree * math.cos(math.radians(origin_lat)), metres_per_degree
 
 
 def project_point(lat: float, lon: float, origin_lat: float, origin_lon: float) -> Tuple[float, float]:
-    """Project WGS84 coordinates to a local tangent plane in metres."""
+    """Project WGS84 coordinates to a local tangent plane in metres.
 
-    radius = 6378137.0
-    lat_rad = math.radians(lat)
-    origin_lat_rad = math.radians(origin_lat)
-    x = radius * math.radians(lon - origin_lon) * math.cos(origin_lat_rad)
-    y = radius * (lat_rad - origin_lat_rad)
-    return x, y
+    Kept for API compatibility only; :func:`project_feature` applies the same
+    formula inline so the scales are computed once per feature.
+    """
+
+    lon_scale, lat_scale = _projection_scales(origin_lat)
+    return lon_scale * (lon - origin_lon), lat_scale * (lat - origin_lat)
 
 
 def project_feature(feature: Feature, origin: Tuple[float, float]) -> Feature:
     origin_lat, origin_lon = origin
+    lon_scale, lat_scale = _projection_scales(origin_lat)
     projected_outer = [
-        project_point(lat, lon, origin_lat, origin_lon) for lat, lon in feature.outer
+        (lon_scale * (lon - origin_lon), lat_scale * (lat - origin_lat))
+        for lat, lon in feature.outer
     ]
     projected_holes = [
-        [project_point(lat, lon, origin_lat, origin_lon) for lat, lon in ring]
+        [(lon_scale * (lon - origin_lon), lat_scale * (lat - origin_lat)) for lat, lon in ring]
         for ring in feature.holes
     ]
     return Feature(
@@ -436,10 +810,115 @@ def project_feature(feature: Feature, origin: Tuple[float, float]) -> Feature:
     )
 
 
+def _node_table_rows(rings: Sequence[Sequence[Tuple[float, float]]]) -> Optional[Tuple[NodeCoordinates, Any]]:
+    """Return the node table behind ``rings`` and their concatenated rows.
+
+    Rings straight from collect_features are views into one table, so their
+    coordinates can be gathered from its arrays without building any tuples.
+    ``None`` if NumPy is missing or any ring is not such a view.
+    """
+
+    if np is None:
+        return None
+    table = None
+    rows = array("q")
+    for ring in rings:
+        if not isinstance(ring, NodeRing):
+            return None
+        if table is None:
+            table = ring._nodes
+        elif ring._nodes is not table:
+            return None
+        rows.extend(ring._rows)
+    if table is None:
+        return None
+    return table, np.frombuffer(rows, dtype=np.int64)
+
+
+def _iter_projected_features(
+    features: Sequence[Feature],
+    origin: Tuple[float, float],
+) -> Iterator[Feature]:
+    """Yield projected copies of ``features`` one at a time.
+
+    With NumPy the coordinates of all features are projected in a single
+    vectorised pass; the per-feature rings are only built as each feature is
+    requested, so no second full list of features is kept alive.  Rings of at
+    least ``_ARRAY_RING_MIN_POINTS`` vertices are yielded as ``(n, 2)`` array
+    views instead of tuple lists.  Only the geometry helpers handle such
+    rings, so this stays internal to ``build_model``.
+    """
+
+    if np is None:
+        for feature in features:
+            yield project_feature(feature, origin)
+        return
+
+    rings: List[Sequence[Tuple[float, float]]] = []
+    for feature in features:
+        rings.append(feature.outer)
+        rings.extend(feature.holes)
+    vertex_count = sum(map(len, rings))
+    if not vertex_count:
+        for feature in features:
+            yield project_feature(feature, origin)
+        return
+
+    # All coordinates go into one (V, 2) array addressed by per-ring offsets
+    # and are projected in place; xs and ys are views of its columns.
+    xy = np.empty((vertex_count, 2))
+    xs = xy[:, 0]
+    ys = xy[:, 1]
+    table_rows = _node_table_rows(rings)
+    if table_rows is not None:
+        table, positions = table_rows
+        np.take(np.frombuffer(table._lon, dtype=np.float64), positions, out=xs)
+        np.take(np.frombuffer(table._lat, dtype=np.float64), positions, out=ys)
+        del table_rows, table, positions
+    else:
+        flat = itertools.chain.from_iterable(itertools.chain.from_iterable(rings))
+        coords = np.fromiter(flat, dtype=np.float64, count=2 * vertex_count).reshape(-1, 2)
+        xs[:] = coords[:, 1]
+        ys[:] = coords[:, 0]
+        del coords, flat
+    del rings
+
+    origin_lat, origin_lon = origin
+    lon_scale, lat_scale = _projection_scales(origin_lat)
+    xs -= origin_lon
+    xs *= lon_scale
+    ys -= origin_lat
+    ys *= lat_scale
+
+    def take(ring: Sequence[Tuple[float, float]], start: int) -> Sequence[Tuple[float, float]]:
+        end = start + len(ring)
+        if end - start >= _ARRAY_RING_MIN_POINTS:
+            return xy[start:end]
+        return list(zip(xs[start:end].tolist(), ys[start:end].tolist()))
+
+    offset = 0
+    for feature in features:
+        outer = take(feature.outer, offset)
+        offset += len(feature.outer)
+        holes = []
+        for hole in feature.holes:
+            holes.append(take(hole, offset))
+            offset += len(hole)
+        yield Feature(osm_id=feature.osm_id, outer=outer, holes=holes, tags=feature.tags)
+
+
 def _ring_signed_area(ring: Sequence[Tuple[float, float]]) -> float:
+    if np is not None and isinstance(ring, np.ndarray):
+        xs = ring[:, 0]
+        ys = ring[:, 1]
+        return 0.5 * float(np.dot(xs[:-1], ys[1:]) - np.dot(xs[1:], ys[:-1]))
+    if not ring:
+        return 0.0
     area = 0.0
-    for (x1, y1), (x2, y2) in zip(ring, ring[1:]):
+    x1, y1 = ring[0]
+    for x2, y2 in ring[1:]:
         area += (x1 * y2) - (x2 * y1)
+        x1, y1 = x2, y2
     return area * 0.5
 
 
@@ -447,25 +926,34 @@ def _prepare_ring_points(
     ring: Sequence[Tuple[float, float]],
     *,
     counter_clockwise: bool,
-) -> Optional[List[rhino3dm.Point3d]]:
+) -> Optional[rhino3dm.Point3dList]:
     if len(ring) < 4:
         return None
 
-    closed_ring: List[Tuple[float, float]] = list(ring)
-    if closed_ring[0] != closed_ring[-1]:
-        closed_ring.append(closed_ring[0])
+    # extract_way_feature and assemble_rings already return closed rings, so
+    # the ring is only copied for caller-supplied features that are not.
+    closed_ring: Sequence[Tuple[float, float]]
+    if np is not None and isinstance(ring, np.ndarray):
+        closed_ring = ring if (ring[0] == ring[-1]).all() else np.vstack((ring, ring[:1]))
+    elif ring[0] == ring[-1]:
+        closed_ring = ring
+    else:
+        closed_ring = [*ring, ring[0]]
 
+    # Orientation is settled on the raw floats so the points are built once.
     area = _ring_signed_area(closed_ring)
     if counter_clockwise and area < 0:
-        closed_ring.reverse()
+        closed_ring = closed_ring[::-1]
     elif not counter_clockwise and area > 0:
-        closed_ring.reverse()
-
-    points = [rhino3dm.Point3d(x, y, 0.0) for x, y in closed_ring]
-    if points[0].DistanceTo(points[-1]) > 1e-6:
-        points.append(points[0])
-    if len(points) < 4:
-        return None
+        closed_ring = closed_ring[::-1]
+    if np is not None and isinstance(closed_ring, np.ndarray):
+        closed_ring = closed_ring.tolist()
+
+    # Filling a Point3dList avoids creating a Point3d wrapper per vertex.
+    points = rhino3dm.Point3dList(len(closed_ring))
+    add_point = points.Add
+    for x, y in closed_ring:
+        add_point(x, y, 0.0)
     return points
 
 
@@ -483,6 +971,30 @@ def _polyline_curve_from_ring(
     return curve.ToNurbsCurve()
 
 
+def _create_simple_extrusion(
+    ring: Sequence[Tuple[float, float]],
+    extrusion_height: float,
+    min_height: float,
+) -> Optional[rhino3dm.Extrusion]:
+    """Extrude a hole-free footprint directly from its polyline profile."""
+
+    points = _prepare_ring_points(ring, counter_clockwise=True)
+    if points is None:
+        return None
+    curve = rhino3dm.PolylineCurve(points)
+    extrusion = rhino3dm.Extrusion.Create(curve, extrusion_height, True)
+    if extrusion is None:
+        # Profiles with repeated vertices are only accepted as NURBS curves.
+        if not curve.IsClosed:
+            return None
+        extrusion = rhino3dm.Extrusion.Create(curve.ToNurbsCurve(), extrusion_height, True)
+        if extrusion is None:
+            return None
+    if min_height:
+        extrusion.Translate(rhino3dm.Vector3d(0.0, 0.0, min_height))
+    return extrusion
+
+
 def create_geometry_from_feature(
     feature: Feature,
     height: float,
@@ -492,6 +1004,9 @@ def create_geometry_from_feature(
     if extrusion_height <= 0:
         return None
 
+    if not feature.holes:
+        return _create_simple_extrusion(feature.outer, extrusion_height, min_height)
+
     outer_curve = _polyline_curve_from_ring(feature.outer, counter_clockwise=True)
     if outer_curve is None:
         return None
@@ -513,13 +1028,15 @@ def create_geometry_from_feature(
         )
         if solid is None:
             return None
-        solid.Translate(rhino3dm.Vector3d(0.0, 0.0, min_height))
+        if min_height:
+            solid.Translate(rhino3dm.Vector3d(0.0, 0.0, min_height))
         return solid
 
     extrusion = rhino3dm.Extrusion.Create(outer_curve, extrusion_height, True)
     if extrusion is None:
         return None
-    extrusion.Translate(rhino3dm.Vector3d(0.0, 0.0, min_height))
+    if min_height:
+        extrusion.Translate(rhino3dm.Vector3d(0.0, 0.0, min_height))
     return extrusion
 
 
@@ -532,16 +1049,49 @@ def add_feature_to_model(
     geometry = create_geometry_from_feature(feature, height, min_height)
     if geometry is None:
         return
+    _add_geometry_to_objects(model.Objects, feature, geometry)
+
+
+def _add_geometry_to_objects(
+    objects: rhino3dm.File3dmObjectTable,
+    feature: Feature,
+    geometry: Union[rhino3dm.Extrusion, rhino3dm.Brep],
+) -> None:
     attributes = rhino3dm.ObjectAttributes()
     attributes.Name = feature.name or feature.osm_id
+    set_user_string = attributes.SetUserString
     for key, value in feature.tags.items():
-        if key.startswith("building") or key in {"height", "min_height", "name"}:
-            attributes.SetUserString(key, value)
-    attributes.SetUserString("osm:id", feature.osm_id)
+        if key in _USER_STRING_TAGS or key.startswith("building"):
+            set_user_string(key, value)
+    set_user_string("osm:id", feature.osm_id)
     if isinstance(geometry, rhino3dm.Extrusion):
-        model.Objects.AddExtrusion(geometry, attributes)
+        objects.AddExtrusion(geometry, attributes)
     else:
-        model.Objects.AddBrep(geometry, attributes)
+        objects.AddBrep(geometry, attributes)
+
+
+def _encode_feature_geometries(
+    features: Sequence[Feature],
+    origin: Tuple[float, float],
+    default_height: float,
+    level_height: float,
+) -> List[Optional[Dict[str, Any]]]:
+    """Worker for ``build_model``: build and encode the geometry of ``features``.
+
+    rhino3dm objects cannot be pickled, so the geometry travels back to the
+    parent process in its ``Encode()`` form.
+    """
+
+    encoded: List[Optional[Dict[str, Any]]] = []
+    for projected in _iter_projected_features(features, origin):
+        height, min_height = building_height(
+            projected.tags,
+            default_height=default_height,
+            level_height=level_height,
+        )
+        geometry = create_geometry_from_feature(projected, height, min_height)
+        encoded.append(None if geometry is None else geometry.Encode())
+    return encoded
 
 
 def build_model(
@@ -550,21 +1100,48 @@ def build_model(
     *,
     default_height: float,
     level_height: float,
+    jobs: int = 1,
 ) -> rhino3dm.File3dm:
     model = rhino3dm.File3dm()
     model.Settings.ModelUnitSystem = rhino3dm.UnitSystem.Meters
     model.Strings.Set("osm_to_3dm", "origin_lat", str(origin[0]))
     model.Strings.Set("osm_to_3dm", "origin_lon", str(origin[1]))
 
-    projected_features = [project_feature(feature, origin) for feature in features]
-
-    for original, projected in zip(features, projected_features):
+    # model.Objects creates a new table wrapper on every access.
+    objects = model.Objects
+
+    if jobs > 1 and len(features) > 1:
+        # Geometry is built in worker processes; only decoding and adding the
+        # objects happens here, in the original feature order.
+        chunk_size = math.ceil(len(features) / (jobs * 4))
+        chunks = [features[i : i + chunk_size] for i in range(0, len(features), chunk_size)]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(
+                _encode_feature_geometries,
+                chunks,
+                itertools.repeat(origin),
+                itertools.repeat(default_height),
+                itertools.repeat(level_height),
+            )
+            for chunk, encoded_geometries in zip(chunks, results):
+                for feature, encoded in zip(chunk, encoded_geometries):
+                    if encoded is None:
+                        continue
+                    geometry = rhino3dm.CommonObject.Decode(encoded)
+                    if geometry is not None:
+                        _add_geometry_to_objects(objects, feature, geometry)
+        return model
+
+    # Each projected feature only lives while it is being added to the model.
+    for projected in _iter_projected_features(features, origin):
         height, min_height = building_height(
-            original.tags,
+            projected.tags,
             default_height=default_height,
             level_height=level_height,
         )
-        add_feature_to_model(model, projected, height, min_height)
+        geometry = create_geometry_from_feature(projected, height, min_height)
+        if geometry is not None:
+            _add_geometry_to_objects(objects, projected, geometry)
 
     return model
 
@@ -574,6 +1151,7 @@ def convert_osm_to_model(
     *,
     default_height: float = DEFAULT_BUILDING_HEIGHT,
     level_height: float = DEFAULT_LEVEL_HEIGHT,
+    jobs: int = 1,
 ) -> rhino3dm.File3dm:
     """Create a Rhino model from an OSM XML source."""
 
@@ -588,11 +1166,25 @@ def convert_osm_to_model(
         origin,
         default_height=default_height,
         level_height=level_height,
+        jobs=jobs,
     )
 
 
 def _model_to_3dm_bytes(model: rhino3dm.File3dm, version: int) -> bytes:
-    """Serialize a Rhino model to bytes using a temporary file."""
+    """Serialize a Rhino model to bytes without touching the disk if possible.
+
+    On Linux the model is written to an anonymous memory file; elsewhere, or
+    if that fails, it goes through a temporary file.
+    """
+
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("osm_to_3dm", os.MFD_CLOEXEC)
+        try:
+            # rhino3dm only writes to paths; /proc/self/fd names the memfd.
+            if model.Write(f"/proc/self/fd/{fd}", version):
+                return os.pread(fd, os.fstat(fd).st_size, 0)
+        finally:
+            os.close(fd)
 
     with tempfile.TemporaryDirectory() as tmpdir:
         temp_path = Path(tmpdir) / "output.3dm"
@@ -607,6 +1199,7 @@ def convert_osm_to_3dm_bytes(
     default_height: float = DEFAULT_BUILDING_HEIGHT,
     level_height: float = DEFAULT_LEVEL_HEIGHT,
     version: int = 7,
+    jobs: int = 1,
 ) -> bytes:
     """Convert an OSM XML source into 3DM bytes."""
 
@@ -614,10 +1207,36 @@ def convert_osm_to_3dm_bytes(
         osm_source,
         default_height=default_height,
         level_height=level_height,
+        jobs=jobs,
     )
     return _model_to_3dm_bytes(model, version)
 
 
+def convert_osm_to_3dm_file(
+    osm_source: OSMSource,
+    destination: Union[Path, str],
+    *,
+    default_height: float = DEFAULT_BUILDING_HEIGHT,
+    level_height: float = DEFAULT_LEVEL_HEIGHT,
+    version: int = 7,
+    jobs: int = 1,
+) -> None:
+    """Convert an OSM XML source and write the 3DM file to ``destination``.
+
+    Unlike :func:`convert_osm_to_3dm_bytes` the serialized model never has to
+    be held in memory, which keeps the peak memory of large conversions down.
+    """
+
+    model = convert_osm_to_model(
+        osm_source,
+        default_height=default_height,
+        level_height=level_height,
+        jobs=jobs,
+    )
+    if not model.Write(str(destination), version):
+        raise RuntimeError(f"Failed to write 3DM file to {destination}")
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parse_args(argv)
     try:
@@ -625,6 +1244,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             args.input,
             default_height=args.default_height,
             level_height=args.level_height,
+            jobs=args.jobs,
         )
     except ValueError as exc:
         print(str(exc), file=sys.stderr)
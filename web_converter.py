@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import argparse
 import cgi
+import shutil
+import tempfile
 from dataclasses import dataclass
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
@@ -14,9 +16,12 @@ from urllib.parse import quote
 from osm_to_3dm import (
     DEFAULT_BUILDING_HEIGHT,
     DEFAULT_LEVEL_HEIGHT,
-    convert_osm_to_3dm_bytes,
+    convert_osm_to_3dm_file,
 )
 
+# Size of the blocks in which converted files are streamed to the client.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 HTML_PAGE = """<!DOCTYPE html>
 <html lang=\"en\">
@@ -263,33 +268,39 @@ class ConverterRequestHandler(BaseHTTPRequestHandler):
             self.send_error(HTTPStatus.BAD_REQUEST, "Empty upload")
             return
 
-        try:
-            payload = convert_osm_to_3dm_bytes(
-                data,
-                default_height=self.config.default_height,
-                level_height=self.config.level_height,
-            )
-        except ValueError as exc:
-            self._send_text_response(str(exc), HTTPStatus.BAD_REQUEST)
-            return
-        except Exception as exc:  # pragma: no cover - unexpected failure path
-            self._send_text_response(f"Conversion failed: {exc}", HTTPStatus.INTERNAL_SERVER_ERROR)
-            return
-
         download_name = Path(filename).stem or "buildings"
         download_name = f"{download_name}.3dm"
         encoded = quote(download_name)
 
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", "application/octet-stream")
-        self.send_header("Content-Length", str(len(payload)))
-        self.send_header(
-            "Content-Disposition",
-            f"attachment; filename=\"{download_name}\"; filename*=UTF-8''{encoded}",
-        )
-        self.send_header("Cache-Control", "no-store")
-        self.end_headers()
-        self.wfile.write(payload)
+        # The model is written to a temporary file and streamed from there, so
+        # the serialized payload is never held in memory as a whole.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "output.3dm"
+            try:
+                convert_osm_to_3dm_file(
+                    data,
+                    output_path,
+                    default_height=self.config.default_height,
+                    level_height=self.config.level_height,
+                )
+            except ValueError as exc:
+                self._send_text_response(str(exc), HTTPStatus.BAD_REQUEST)
+                return
+            except Exception as exc:  # pragma: no cover - unexpected failure path
+                self._send_text_response(f"Conversion failed: {exc}", HTTPStatus.INTERNAL_SERVER_ERROR)
+                return
+
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(output_path.stat().st_size))
+            self.send_header(
+                "Content-Disposition",
+                f"attachment; filename=\"{download_name}\"; filename*=UTF-8''{encoded}",
+            )
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            with output_path.open("rb") as payload:
+                shutil.copyfileobj(payload, self.wfile, _STREAM_CHUNK_SIZE)
 
     def log_message(self, format: str, *args) -> None:  # noqa: A003 - matching BaseHTTPRequestHandler signature
         # Reduce noise – stdout already shows startup instructions.